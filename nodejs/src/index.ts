@@ -1,32 +1,66 @@
 #!/usr/bin/env node
 
-import { Command } from 'commander';
-import { ProjectMemoryServer } from './server.js';
+// Nothing is exported, but the file has to be a module: as a global script
+// its declarations would leak into every other file's scope
+export {};
 
-const program = new Command();
+type CliOptions = {
+  projectRoot: string;
+  memoryDir: string;
+  verbose: boolean;
+  config?: string;
+};
 
-program
-  .name('project-memory-mcp')
-  .description('Persistent project memory MCP server for AI assistants')
-  .version('1.0.0')
-  .option('-r, --project-root <path>', 'Root directory of the project', process.cwd())
-  .option('-m, --memory-dir <path>', 'Directory for memory files', '.project_memory')
-  .option('-v, --verbose', 'Enable verbose logging', false)
-  .option('-c, --config <path>', 'Configuration file path')
-  .parse();
+const DEFAULT_OPTIONS: CliOptions = {
+  projectRoot: process.cwd(),
+  memoryDir: '.project_memory',
+  verbose: false
+};
 
-const options = program.opts();
+// Filesystem error codes caused by the project root or memory directory
+const EXPECTED_STARTUP_ERRORS = new Set(['ENOENT', 'ENOTDIR', 'EACCES', 'EPERM', 'EROFS']);
+
+async function parseOptions(): Promise<CliOptions> {
+  // MCP clients usually launch the server without arguments, and then
+  // there is nothing for commander to parse
+  if (process.argv.length <= 2) {
+    return DEFAULT_OPTIONS;
+  }
+
+  const { Command } = await import('commander');
+  const program = new Command();
+
+  program
+    .name('project-memory-mcp')
+    .description('Persistent project memory MCP server for AI assistants')
+    .version('1.0.0')
+    .option('-r, --project-root <path>', 'Root directory of the project', DEFAULT_OPTIONS.projectRoot)
+    .option('-m, --memory-dir <path>', 'Directory for memory files', DEFAULT_OPTIONS.memoryDir)
+    .option('-v, --verbose', 'Enable verbose logging', DEFAULT_OPTIONS.verbose)
+    .option('-c, --config <path>', 'Configuration file path')
+    .parse();
+
+  return program.opts<CliOptions>();
+}
 
 async function main() {
+  const options = await parseOptions();
+
   try {
     if (options.verbose) {
-      console.error('🧠 Project Memory MCP Server (Node.js)');
-      console.error('=====================================');
-      console.error(`Project Root: ${options.projectRoot}`);
-      console.error(`Memory Directory: ${options.memoryDir}`);
-      console.error('');
+      console.error([
+        '🧠 Project Memory MCP Server (Node.js)',
+        '=====================================',
+        `Project Root: ${options.projectRoot}`,
+        `Memory Directory: ${options.memoryDir}`,
+        ''
+      ].join('\n'));
     }
 
+    // Loaded only once the arguments parse, so --help, --version and usage
+    // errors exit without pulling in the MCP SDK and memory modules
+    const { ProjectMemoryServer } = await import('./server.js');
+
     const server = new ProjectMemoryServer({
       projectRoot: options.projectRoot,
       memoryDir: options.memoryDir,
@@ -34,9 +68,37 @@ async function main() {
       configFile: options.config
     });
 
+    // Let running tool calls finish and pending writes land before exiting.
+    // Registered before start() so a signal during startup is not lost, and
+    // also run when the client closes stdin, which is how most MCP clients
+    // end a session
+    let stopping = false;
+    const stop = () => {
+      if (stopping) {
+        return;
+      }
+      stopping = true;
+      server.shutdown()
+        .catch(error => {
+          console.error('❌ Error shutting down server:', error);
+          process.exitCode = 1;
+        })
+        .finally(() => process.exit());
+    };
+    process.once('SIGINT', stop);
+    process.once('SIGTERM', stop);
+    process.stdin.once('end', stop);
+
     await server.start();
   } catch (error) {
-    console.error('❌ Error starting server:', error);
+    // Bad paths and permissions are reported in one line; anything
+    // unexpected keeps its stack trace
+    const code = (error as NodeJS.ErrnoException)?.code;
+    if (code && EXPECTED_STARTUP_ERRORS.has(code)) {
+      console.error(`❌ Error starting server: ${(error as Error).message}`);
+    } else {
+      console.error('❌ Error starting server:', error);
+    }
     process.exit(1);
   }
 }
@@ -7,9 +7,38 @@ import {
   ArchitectureDecision, 
   WorkingSolution, 
   ConversationContext, 
+  JournalEntry,
+  MemoryChange,
+  SearchResult,
   ServerConfig,
   ServerOptions 
 } from './types.js';
+import { SearchIndex } from './search-index.js';
+
+// Characters replaced when an ISO timestamp is used in a backup file name
+const TIMESTAMP_SEPARATORS = /[:.]/g;
+
+// How long journaled changes may settle before current_context.json is rewritten
+const CONTEXT_WRITE_DELAY_MS = 1000;
+
+// Number of backup files kept in the backups directory
+const MAX_BACKUPS = 10;
+
+// Ids are a per-process prefix plus a counter: the prefix keeps them
+// distinct from ids made by earlier runs, the counter within this one
+const ID_PREFIX = Date.now().toString(36) + Math.random().toString(36).slice(2, 8);
+let nextIdSequence = 0;
+
+// Marker files identifying a project type, checked in order
+const PROJECT_MARKERS: [string[], string][] = [
+  [['package.json'], 'Node.js/JavaScript'],
+  [['requirements.txt', 'pyproject.toml'], 'Python'],
+  [['Cargo.toml'], 'Rust'],
+  [['go.mod'], 'Go'],
+  [['pom.xml'], 'Java/Maven'],
+  [['build.gradle'], 'Java/Gradle'],
+  [['docker-compose.yml'], 'Docker/Microservices']
+];
 
 export class MemoryManager {
   private projectRoot: string;
@@ -17,8 +46,29 @@ export class MemoryManager {
   private verbose: boolean;
   private config: ServerConfig;
   private memory!: ProjectMemory;
+  // Last journal sequence number applied to memory, and how many entries
+  // the journal holds on top of the latest snapshot
+  private journalSequence = 0;
+  private journalLength = 0;
+  // Appends are not fsynced one by one; flush() syncs the journal once
+  // if anything was appended since the last snapshot or sync
+  private journalUnsynced = false;
+  private searchIndex = new SearchIndex();
+  private detectedProjectType?: string;
+  private contextWriteTimer?: NodeJS.Timeout;
+  // Sizes of the keyed collections, kept current by applyChange so the
+  // counts do not have to enumerate every key
+  private componentCount = 0;
+  private solutionCount = 0;
+  // Backup file names, oldest first, read from disk on the first backup
+  private backupFiles?: string[];
+  private encodedRecords = new WeakMap<object, string>();
+  private diskQueue: Promise<unknown> = Promise.resolve();
+  private lastBackupTime = 0;
   
   private memoryFile: string;
+  private backupDir: string;
+  private journalFile: string;
   private contextFile: string;
   private decisionsFile: string;
   private solutionsFile: string;
@@ -31,6 +81,8 @@ export class MemoryManager {
     
     // Memory file paths
     this.memoryFile = path.join(this.memoryDir, 'project_memory.json');
+    this.journalFile = path.join(this.memoryDir, 'journal.jsonl');
+    this.backupDir = path.join(this.memoryDir, 'backups');
     this.contextFile = path.join(this.memoryDir, 'current_context.json');
     this.decisionsFile = path.join(this.memoryDir, 'architecture_decisions.json');
     this.solutionsFile = path.join(this.memoryDir, 'working_solutions.json');
@@ -40,8 +92,7 @@ export class MemoryManager {
     this.config = this.loadConfig(options.configFile);
     
     if (this.verbose) {
-      console.error(`📁 Memory directory: ${this.memoryDir}`);
-      console.error(`📝 Memory files initialized`);
+      console.error(`📁 Memory directory: ${this.memoryDir}\n📝 Memory files initialized`);
     }
   }
 
@@ -49,19 +100,24 @@ export class MemoryManager {
     // Ensure memory directory exists
     await fs.ensureDir(this.memoryDir);
     
-    // Load or initialize memory
+    // Load or initialize memory, then replay changes made since the last snapshot
     this.memory = await this.loadMemory();
+    this.rebuildSearchIndex();
+    this.recountEntries();
+    this.journalSequence = this.memory.metadata.journal_sequence ?? 0;
+    await this.replayJournal();
     
     if (this.verbose) {
-      console.error('✅ Project memory initialized successfully!');
-      console.error('');
-      const context = this.getCurrentContext();
-      console.error(`📊 Project: ${context.project_name}`);
-      console.error(`📈 Components tracked: ${Object.keys(context.components).length}`);
-      console.error(`🏗️ Architecture decisions: ${context.recent_decisions.length}`);
-      console.error(`🔧 Working solutions: ${Object.keys(context.solutions).length}`);
-      console.error(`💬 Conversation history: ${context.recent_conversations.length}`);
-      console.error('');
+      console.error([
+        '✅ Project memory initialized successfully!',
+        '',
+        `📊 Project: ${this.memory.project_info.name}`,
+        `📈 Components tracked: ${this.getComponentCount()}`,
+        `🏗️ Architecture decisions: ${this.getDecisionCount()}`,
+        `🔧 Working solutions: ${this.getSolutionCount()}`,
+        `💬 Conversation history: ${this.getConversationCount()}`,
+        ''
+      ].join('\n'));
     }
   }
 
@@ -71,7 +127,8 @@ export class MemoryManager {
       backup_enabled: true,
       backup_interval: 3600,
       compression_enabled: false,
-      auto_detect_project_type: true
+      auto_detect_project_type: true,
+      journal_snapshot_threshold: 100
     };
 
     if (configFile && fs.existsSync(configFile)) {
@@ -157,7 +214,8 @@ export class MemoryManager {
       metadata: {
         version: memory?.metadata?.version || '1.0.0',
         created_at: memory?.metadata?.created_at || now,
-        last_updated: now
+        last_updated: now,
+        journal_sequence: memory?.metadata?.journal_sequence ?? 0
       }
     };
 
@@ -169,46 +227,53 @@ export class MemoryManager {
   }
 
   private detectProjectType(): string {
-    try {
-      if (fs.existsSync(path.join(this.projectRoot, 'package.json'))) {
-        return 'Node.js/JavaScript';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'requirements.txt')) || 
-          fs.existsSync(path.join(this.projectRoot, 'pyproject.toml'))) {
-        return 'Python';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'Cargo.toml'))) {
-        return 'Rust';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'go.mod'))) {
-        return 'Go';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'pom.xml'))) {
-        return 'Java/Maven';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'build.gradle'))) {
-        return 'Java/Gradle';
-      }
-      if (fs.existsSync(path.join(this.projectRoot, 'docker-compose.yml'))) {
-        return 'Docker/Microservices';
+    // The project root does not change, so it is listed only once
+    if (this.detectedProjectType === undefined) {
+      this.detectedProjectType = 'unknown';
+      try {
+        const entries = new Set(fs.readdirSync(this.projectRoot));
+        const match = PROJECT_MARKERS.find(([files]) => files.some(file => entries.has(file)));
+        if (match) {
+          this.detectedProjectType = match[1];
+        }
+      } catch (error) {
+        // Ignore errors in detection
       }
-    } catch (error) {
-      // Ignore errors in detection
     }
-    return 'unknown';
+    return this.detectedProjectType;
   }
   async saveMemory(): Promise<void> {
+    return this.runExclusive(() => this.writeSnapshot());
+  }
+
+  // Journal appends and snapshots run one at a time, in the order queued
+  private runExclusive<T>(task: () => Promise<T>): Promise<T> {
+    const result = this.diskQueue.then(task);
+    this.diskQueue = result.catch(() => undefined);
+    return result;
+  }
+
+  private async writeSnapshot(): Promise<void> {
     try {
-      this.memory.metadata.last_updated = new Date().toISOString();
-      await fs.writeJson(this.memoryFile, this.memory, { spaces: 2 });
+      // One clock read names both the snapshot and its backup
+      const now = new Date().toISOString();
+      this.memory.metadata.last_updated = now;
+      this.memory.metadata.journal_sequence = this.journalSequence;
+      // The memory file is only read back by the server, so it is written
+      // compact; current_context.json stays indented for people to read
+      await this.replaceFile(this.memoryFile, this.serializeMemory());
+
+      // The snapshot now holds every journaled change
+      await fs.remove(this.journalFile);
+      this.journalLength = 0;
+      this.journalUnsynced = false;
       
-      // Save current context snapshot
-      const context = this.getCurrentContext();
-      await fs.writeJson(this.contextFile, context, { spaces: 2 });
+      await this.writeContextFile();
       
-      // Create backup if enabled
-      if (this.config.backup_enabled) {
-        await this.createBackup();
+      // Create backup if enabled and the backup interval has passed
+      if (this.config.backup_enabled &&
+          Date.parse(now) - this.lastBackupTime >= this.config.backup_interval * 1000) {
+        await this.createBackup(now);
       }
     } catch (error) {
       if (this.verbose) {
@@ -218,26 +283,109 @@ export class MemoryManager {
     }
   }
 
-  private async createBackup(): Promise<void> {
+  // Wait for queued journal, snapshot and context writes, make the journal
+  // durable, and write a pending current_context.json now instead of when
+  // its timer fires
+  async flush(): Promise<void> {
+    await this.runExclusive(async () => {
+      if (this.journalUnsynced) {
+        await this.syncJournal();
+      }
+      if (this.contextWriteTimer) {
+        await this.writeContextFile();
+      }
+    });
+  }
+
+  // Same output as JSON.stringify(this.memory), but decisions, solutions and
+  // conversations are never modified once stored, so each one is encoded
+  // only the first time it is written and reused by every later snapshot
+  private serializeMemory(): string {
+    const memory = this.memory;
+    const solutions = Object.entries(memory.working_solutions)
+      .filter(([, solution]) => solution !== undefined)
+      .map(([id, solution]) => `${JSON.stringify(id)}:${this.encodeRecord(solution)}`);
+
+    return `{"project_info":${JSON.stringify(memory.project_info)}` +
+      `,"implementation_status":${JSON.stringify(memory.implementation_status)}` +
+      `,"architecture":{"technologies":${JSON.stringify(memory.architecture.technologies)}` +
+      `,"decisions":[${memory.architecture.decisions.map(decision => this.encodeRecord(decision)).join(',')}]}` +
+      `,"working_solutions":{${solutions.join(',')}}` +
+      `,"current_priorities":${JSON.stringify(memory.current_priorities)}` +
+      `,"conversations":[${memory.conversations.map(conversation => this.encodeRecord(conversation)).join(',')}]` +
+      `,"metadata":${JSON.stringify(memory.metadata)}}`;
+  }
+
+  private encodeRecord(record: unknown): string {
+    // Malformed entries loaded from disk cannot be WeakMap keys
+    if (record === null || typeof record !== 'object') {
+      return JSON.stringify(record) ?? 'null';
+    }
+
+    let encoded = this.encodedRecords.get(record);
+    if (encoded === undefined) {
+      encoded = JSON.stringify(record);
+      this.encodedRecords.set(record, encoded);
+    }
+    return encoded;
+  }
+
+  // Write to a temporary file, flush it to disk, then rename it over the
+  // target so a crash mid-write can never leave a truncated memory file.
+  // The journal is only removed after this returns, so it still covers any
+  // changes the previous snapshot is missing until the rename lands
+  private async replaceFile(file: string, data: string): Promise<void> {
+    const tempFile = `${file}.tmp`;
+    const fd = await fs.open(tempFile, 'w');
     try {
-      const backupDir = path.join(this.memoryDir, 'backups');
-      await fs.ensureDir(backupDir);
-      
-      const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-      const backupFile = path.join(backupDir, `memory_backup_${timestamp}.json`);
+      await fs.writeFile(fd, data);
+      await fs.fdatasync(fd);
+    } finally {
+      await fs.close(fd);
+    }
+    await fs.rename(tempFile, file);
+  }
+
+  private async syncJournal(): Promise<void> {
+    const fd = await fs.open(this.journalFile, 'a');
+    try {
+      await fs.fdatasync(fd);
+    } finally {
+      await fs.close(fd);
+    }
+    this.journalUnsynced = false;
+  }
+
+  private async createBackup(now: string, data?: string): Promise<void> {
+    try {
+      // The backup directory is listed once; after that the list of backups
+      // is kept here, oldest first, so pruning needs no directory scan
+      if (!this.backupFiles) {
+        await fs.ensureDir(this.backupDir);
+        this.backupFiles = (await fs.readdir(this.backupDir))
+          .filter(f => f.startsWith('memory_backup_') && f.endsWith('.json'))
+          .sort();
+      }
       
-      await fs.writeJson(backupFile, this.memory, { spaces: 2 });
+      const timestamp = now.replace(TIMESTAMP_SEPARATORS, '-');
+      const backupName = `memory_backup_${timestamp}.json`;
+      const backupFile = path.join(this.backupDir, backupName);
       
-      // Keep only last 10 backups
-      const backups = await fs.readdir(backupDir);
-      const backupFiles = backups
-        .filter(f => f.startsWith('memory_backup_') && f.endsWith('.json'))
-        .sort()
-        .reverse();
+      // Without data, back up the snapshot that was just written
+      if (data === undefined) {
+        await fs.copyFile(this.memoryFile, backupFile);
+      } else {
+        await fs.writeFile(backupFile, data);
+      }
+      this.lastBackupTime = Date.parse(now);
+      if (this.backupFiles[this.backupFiles.length - 1] !== backupName) {
+        this.backupFiles.push(backupName);
+      }
       
-      if (backupFiles.length > 10) {
-        for (const oldBackup of backupFiles.slice(10)) {
-          await fs.remove(path.join(backupDir, oldBackup));
+      // Keep only the most recent backups
+      if (this.backupFiles.length > MAX_BACKUPS) {
+        for (const oldBackup of this.backupFiles.splice(0, this.backupFiles.length - MAX_BACKUPS)) {
+          await fs.remove(path.join(this.backupDir, oldBackup));
         }
       }
     } catch (error) {
@@ -247,6 +395,194 @@ export class MemoryManager {
     }
   }
 
+  private async replayJournal(): Promise<void> {
+    if (!(await fs.pathExists(this.journalFile))) {
+      return;
+    }
+
+    const lines = (await fs.readFile(this.journalFile, 'utf8')).split('\n');
+    let skipped = false;
+    for (const line of lines) {
+      if (!line) {
+        continue;
+      }
+
+      let entry: JournalEntry;
+      try {
+        entry = JSON.parse(line);
+      } catch (error) {
+        // A crash mid-append can leave a partial last line
+        if (this.verbose) {
+          console.error(`⚠️ Warning: Skipping unreadable journal entry: ${error}`);
+        }
+        skipped = true;
+        continue;
+      }
+
+      // Entries already folded into the snapshot are skipped, which keeps
+      // replay safe if we stopped between writing a snapshot and truncating
+      if (entry.seq > this.journalSequence) {
+        this.applyChange(entry);
+        this.journalSequence = entry.seq;
+      }
+      this.journalLength++;
+    }
+
+    if (this.verbose) {
+      console.error(`📜 Replayed ${this.journalLength} journal entries`);
+    }
+
+    // Compact right away so new entries are not appended after a torn line
+    if (skipped) {
+      await this.saveMemory();
+    }
+  }
+
+  // Apply a change and journal it; snapshot once the journal passes the threshold
+  private async commitChange(change: MemoryChange, timestamp: string = new Date().toISOString()): Promise<void> {
+    const entry: JournalEntry = {
+      ...change,
+      seq: this.journalSequence + 1,
+      timestamp
+    };
+
+    this.applyChange(entry);
+    this.journalSequence = entry.seq;
+
+    await this.runExclusive(async () => {
+      try {
+        await fs.appendFile(this.journalFile, `${JSON.stringify(entry)}\n`);
+        this.journalLength++;
+        this.journalUnsynced = true;
+      } catch (error) {
+        if (this.verbose) {
+          console.error(`❌ Error writing memory journal: ${error}`);
+        }
+        throw error;
+      }
+
+      if (this.journalLength >= this.config.journal_snapshot_threshold) {
+        await this.writeSnapshot();
+      } else {
+        this.scheduleContextWrite();
+      }
+    });
+  }
+
+  // current_context.json is only a readable copy of getCurrentContext(), so
+  // bursts of changes are coalesced into a single write after they settle
+  private scheduleContextWrite(): void {
+    if (this.contextWriteTimer) {
+      return;
+    }
+
+    // Queued so flush() covers it; the timer stays referenced so it is not lost on exit
+    this.contextWriteTimer = setTimeout(() => {
+      this.runExclusive(() => this.writeContextFile()).catch(error => {
+        if (this.verbose) {
+          console.error(`⚠️ Warning: Could not write context file: ${error}`);
+        }
+      });
+    }, CONTEXT_WRITE_DELAY_MS);
+  }
+
+  private async writeContextFile(): Promise<void> {
+    if (this.contextWriteTimer) {
+      clearTimeout(this.contextWriteTimer);
+      this.contextWriteTimer = undefined;
+    }
+
+    await fs.writeJson(this.contextFile, this.getCurrentContext(), { spaces: 2 });
+  }
+
+  private applyChange(entry: JournalEntry): void {
+    switch (entry.type) {
+      case 'component_status':
+        if (!Object.prototype.hasOwnProperty.call(this.memory.implementation_status.components, entry.component)) {
+          this.componentCount++;
+        }
+        this.memory.implementation_status.components[entry.component] = entry.status;
+        break;
+
+      case 'architecture_decision':
+        this.memory.architecture.decisions.push(entry.decision);
+        this.indexDecision(entry.decision);
+        break;
+
+      case 'working_solution': {
+        const previous = this.memory.working_solutions[entry.solution.id];
+        if (previous) {
+          this.searchIndex.remove(previous);
+        } else {
+          this.solutionCount++;
+        }
+        this.memory.working_solutions[entry.solution.id] = entry.solution;
+        this.indexSolution(entry.solution);
+        break;
+      }
+
+      case 'priorities':
+        this.memory.current_priorities = entry.priorities;
+        break;
+
+      case 'conversation':
+        this.memory.conversations.push(entry.conversation);
+        this.indexConversation(entry.conversation);
+
+        // Keep only the most recent conversations. Trimming in place drops
+        // the overflow (normally a single entry) without copying the rest
+        // of the history into a new array on every append
+        if (this.memory.conversations.length > this.config.max_conversation_history) {
+          const overflow = this.memory.conversations.length - this.config.max_conversation_history;
+          for (const dropped of this.memory.conversations.splice(0, overflow)) {
+            this.searchIndex.remove(dropped);
+          }
+        }
+        break;
+    }
+
+    this.memory.metadata.last_updated = entry.timestamp;
+  }
+
+  private rebuildSearchIndex(): void {
+    this.searchIndex.clear();
+
+    for (const decision of this.memory.architecture.decisions) {
+      if (decision) {
+        this.indexDecision(decision);
+      }
+    }
+    for (const solution of Object.values(this.memory.working_solutions)) {
+      if (solution) {
+        this.indexSolution(solution);
+      }
+    }
+    for (const conversation of this.memory.conversations) {
+      if (conversation) {
+        this.indexConversation(conversation);
+      }
+    }
+  }
+
+  private recountEntries(): void {
+    this.componentCount = Object.keys(this.memory.implementation_status.components).length;
+    this.solutionCount = Object.keys(this.memory.working_solutions).length;
+  }
+
+  private indexDecision(decision: ArchitectureDecision): void {
+    this.searchIndex.add('decision', decision, [decision.decision, decision.rationale],
+      `${decision.decision} ${decision.rationale}`);
+  }
+
+  private indexSolution(solution: WorkingSolution): void {
+    this.searchIndex.add('solution', solution, [solution.problem, solution.solution],
+      `${solution.problem} ${solution.solution}`);
+  }
+
+  private indexConversation(conversation: ConversationContext): void {
+    this.searchIndex.add('conversation', conversation, [conversation.summary], conversation.summary);
+  }
+
   getCurrentContext(): ProjectContext {
     return {
       project_name: this.memory.project_info.name,
@@ -263,20 +599,39 @@ export class MemoryManager {
       last_updated: this.memory.metadata.last_updated
     };
   }
+
+  getComponentCount(): number {
+    return this.componentCount;
+  }
+
+  getDecisionCount(): number {
+    return this.memory.architecture.decisions.length;
+  }
+
+  getSolutionCount(): number {
+    return this.solutionCount;
+  }
+
+  getConversationCount(): number {
+    return this.memory.conversations.length;
+  }
   async updateImplementationStatus(
     component: string, 
     status: ComponentStatus['status'], 
     details?: string, 
     progress?: number
   ): Promise<void> {
-    this.memory.implementation_status.components[component] = {
-      status,
-      progress: progress ?? 0,
-      details,
-      lastUpdated: new Date().toISOString()
-    };
-    
-    await this.saveMemory();
+    const now = new Date().toISOString();
+    await this.commitChange({
+      type: 'component_status',
+      component,
+      status: {
+        status,
+        progress: progress ?? 0,
+        details,
+        lastUpdated: now
+      }
+    }, now);
     
     if (this.verbose) {
       console.error(`📈 Updated ${component}: ${status} (${progress ?? 0}%)`);
@@ -289,18 +644,19 @@ export class MemoryManager {
     impact?: string, 
     alternatives?: string[]
   ): Promise<void> {
+    const now = new Date().toISOString();
+    // Stored records never change, so they do not share the caller's arrays
     const newDecision: ArchitectureDecision = {
       id: this.generateId(),
       decision,
       rationale,
       impact,
-      alternatives,
-      date: new Date().toISOString(),
+      alternatives: alternatives?.slice(),
+      date: now,
       tags: []
     };
     
-    this.memory.architecture.decisions.push(newDecision);
-    await this.saveMemory();
+    await this.commitChange({ type: 'architecture_decision', decision: newDecision }, now);
     
     if (this.verbose) {
       console.error(`🏗️ Added architecture decision: ${decision}`);
@@ -314,18 +670,18 @@ export class MemoryManager {
     tags?: string[]
   ): Promise<void> {
     const id = this.generateId();
+    const now = new Date().toISOString();
     const newSolution: WorkingSolution = {
       id,
       problem,
       solution,
       command,
-      tags: tags ?? [],
-      date: new Date().toISOString(),
+      tags: tags?.slice() ?? [],
+      date: now,
       successCount: 1
     };
     
-    this.memory.working_solutions[id] = newSolution;
-    await this.saveMemory();
+    await this.commitChange({ type: 'working_solution', solution: newSolution }, now);
     
     if (this.verbose) {
       console.error(`🔧 Added working solution: ${problem}`);
@@ -333,8 +689,7 @@ export class MemoryManager {
   }
 
   async updatePriorities(priorities: string[]): Promise<void> {
-    this.memory.current_priorities = priorities;
-    await this.saveMemory();
+    await this.commitChange({ type: 'priorities', priorities });
     
     if (this.verbose) {
       console.error(`🎯 Updated priorities: ${priorities.length} items`);
@@ -345,70 +700,36 @@ export class MemoryManager {
     decisions_made?: string[], 
     solutions_found?: string[]
   ): Promise<void> {
+    const now = new Date().toISOString();
     const context: ConversationContext = {
       id: this.generateId(),
       summary,
-      decisions_made,
-      solutions_found,
-      date: new Date().toISOString()
+      decisions_made: decisions_made?.slice(),
+      solutions_found: solutions_found?.slice(),
+      date: now
     };
     
-    this.memory.conversations.push(context);
-    
-    // Keep only the most recent conversations
-    if (this.memory.conversations.length > this.config.max_conversation_history) {
-      this.memory.conversations = this.memory.conversations.slice(-this.config.max_conversation_history);
-    }
-    
-    await this.saveMemory();
+    await this.commitChange({ type: 'conversation', conversation: context }, now);
     
     if (this.verbose) {
       console.error(`💬 Logged conversation: ${summary}`);
     }
   }
 
-  searchMemory(query: string, limit: number = 10): any[] {
-    const results: any[] = [];
+  searchMemory(query: string, limit: number = 10): SearchResult[] {
+    // Results are built in the shape the search_memory tool returns
+    const results: SearchResult[] = [];
     const queryLower = query.toLowerCase();
+    const queryWords = queryLower.split(' ');
     
-    // Search architecture decisions
-    if (this.memory?.architecture?.decisions && Array.isArray(this.memory.architecture.decisions)) {
-      for (const decision of this.memory.architecture.decisions) {
-        if (decision?.decision?.toLowerCase().includes(queryLower) ||
-            decision?.rationale?.toLowerCase().includes(queryLower)) {
-          results.push({
-            type: 'decision',
-            relevance: this.calculateRelevance(queryLower, decision.decision + ' ' + decision.rationale),
-            data: decision
-          });
-        }
-      }
-    }
-    
-    // Search working solutions
-    if (this.memory?.working_solutions && typeof this.memory.working_solutions === 'object') {
-      for (const solution of Object.values(this.memory.working_solutions)) {
-        if (solution?.problem?.toLowerCase().includes(queryLower) ||
-            solution?.solution?.toLowerCase().includes(queryLower)) {
-          results.push({
-            type: 'solution',
-            relevance: this.calculateRelevance(queryLower, solution.problem + ' ' + solution.solution),
-            data: solution
-          });
-        }
-      }
-    }
-    
-    // Search conversations
-    if (this.memory?.conversations && Array.isArray(this.memory.conversations)) {
-      for (const conversation of this.memory.conversations) {
-        if (conversation?.summary?.toLowerCase().includes(queryLower)) {
-          results.push({
-            type: 'conversation',
-            relevance: this.calculateRelevance(queryLower, conversation.summary),
-            data: conversation
-          });
-        }
+    // Only records sharing every trigram with the query can match
+    for (const record of this.searchIndex.candidates(queryLower)) {
+      if (record.fields.some(field => field.includes(queryLower))) {
+        results.push({
+          type: record.type,
+          relevance: this.scoreRelevance(queryLower, queryWords, record.textLower, record.textWords),
+          content: record.content
+        });
       }
     }
     
@@ -420,6 +741,11 @@ export class MemoryManager {
 
   private calculateRelevance(query: string, text: string): number {
     const textLower = text.toLowerCase();
+    return this.scoreRelevance(query, query.split(' '), textLower, textLower.split(' '));
+  }
+
+  // Takes the words already split from the query and the lowercased text
+  private scoreRelevance(query: string, queryWords: string[], textLower: string, textWords: string[]): number {
     let score = 0;
     
     // Exact match bonus
@@ -428,9 +754,6 @@ export class MemoryManager {
     }
     
     // Word match scoring
-    const queryWords = query.split(' ');
-    const textWords = textLower.split(' ');
-    
     for (const queryWord of queryWords) {
       for (const textWord of textWords) {
         if (textWord.includes(queryWord)) {
@@ -443,15 +766,15 @@ export class MemoryManager {
   }
 
   private generateId(): string {
-    return Date.now().toString(36) + Math.random().toString(36).substr(2);
+    return `${ID_PREFIX}-${(nextIdSequence++).toString(36)}`;
   }
 
   async clearMemory(scope: string = 'all', createBackup: boolean = true): Promise<string> {
-    if (createBackup) {
-      await this.createBackup();
-    }
-
+    // Memory is reset right away, like any other change; only the backup
+    // and snapshot writes wait their turn in the disk queue
     const now = new Date().toISOString();
+    const backup = createBackup ? this.serializeMemory() : undefined;
+
     const projectName = path.basename(this.projectRoot);
 
     switch (scope) {
@@ -505,7 +828,15 @@ export class MemoryManager {
         throw new Error(`Unknown scope: ${scope}. Use: all, decisions, solutions, conversations, or components`);
     }
 
-    await this.saveMemory();
+    this.rebuildSearchIndex();
+    this.recountEntries();
+
+    await this.runExclusive(async () => {
+      if (backup !== undefined) {
+        await this.createBackup(now, backup);
+      }
+      await this.writeSnapshot();
+    });
 
     if (this.verbose) {
       console.error(`🗑️ Cleared memory scope: ${scope}`);
@@ -0,0 +1,121 @@
+import { SearchResult } from './types.js';
+
+type SearchContent = SearchResult['content'];
+
+export interface IndexedRecord {
+  type: SearchResult['type'];
+  content: SearchContent;
+  // Lowercased searchable fields, each matched on its own
+  fields: string[];
+  // Lowercased text the relevance score is computed from, and its words,
+  // prepared once here instead of on every query
+  textLower: string;
+  textWords: string[];
+  order: number;
+}
+
+const TYPE_RANK: Record<SearchResult['type'], number> = {
+  decision: 0,
+  solution: 1,
+  conversation: 2
+};
+
+const GRAM_SIZE = 3;
+
+function trigrams(text: string, into: Set<string> = new Set()): Set<string> {
+  for (let i = 0; i + GRAM_SIZE <= text.length; i++) {
+    into.add(text.substring(i, i + GRAM_SIZE));
+  }
+  return into;
+}
+
+// Trigram index over the searchable memory records. A field containing the
+// query as a substring must contain every trigram of the query, so
+// intersecting the postings gives a candidate superset without scanning
+// every record; callers still confirm the substring match on candidates.
+export class SearchIndex {
+  private records = new Map<SearchContent, IndexedRecord>();
+  private postings = new Map<string, Set<IndexedRecord>>();
+  private nextOrder = 0;
+
+  clear(): void {
+    this.records.clear();
+    this.postings.clear();
+    this.nextOrder = 0;
+  }
+
+  add(type: SearchResult['type'], content: SearchContent, fields: (string | undefined)[], text: string): void {
+    this.remove(content);
+
+    const textLower = text.toLowerCase();
+    const record: IndexedRecord = {
+      type,
+      content,
+      fields: fields.filter((field): field is string => typeof field === 'string').map(field => field.toLowerCase()),
+      textLower,
+      textWords: textLower.split(' '),
+      order: this.nextOrder++
+    };
+    this.records.set(content, record);
+
+    for (const gram of this.recordTrigrams(record)) {
+      let posting = this.postings.get(gram);
+      if (!posting) {
+        posting = new Set();
+        this.postings.set(gram, posting);
+      }
+      posting.add(record);
+    }
+  }
+
+  remove(content: SearchContent): void {
+    const record = this.records.get(content);
+    if (!record) {
+      return;
+    }
+
+    this.records.delete(content);
+    for (const gram of this.recordTrigrams(record)) {
+      const posting = this.postings.get(gram);
+      posting?.delete(record);
+      if (posting?.size === 0) {
+        this.postings.delete(gram);
+      }
+    }
+  }
+
+  // Records that may contain the lowercased query, in the order a full scan
+  // would visit them (decisions, then solutions, then conversations)
+  candidates(queryLower: string): IndexedRecord[] {
+    const queryGrams = trigrams(queryLower);
+    let matches: IndexedRecord[];
+
+    if (queryGrams.size === 0) {
+      // Too short to use the index
+      matches = Array.from(this.records.values());
+    } else {
+      const postings: Set<IndexedRecord>[] = [];
+      for (const gram of queryGrams) {
+        const posting = this.postings.get(gram);
+        if (!posting) {
+          return [];
+        }
+        postings.push(posting);
+      }
+
+      postings.sort((a, b) => a.size - b.size);
+      const [smallest, ...rest] = postings;
+      matches = Array.from(smallest).filter(record => rest.every(posting => posting.has(record)));
+    }
+
+    return matches.sort((a, b) => TYPE_RANK[a.type] - TYPE_RANK[b.type] || a.order - b.order);
+  }
+
+  private recordTrigrams(record: IndexedRecord): Set<string> {
+    const grams = new Set<string>();
+    for (const field of record.fields) {
+      trigrams(field, grams);
+    }
+    return grams;
+  }
+}
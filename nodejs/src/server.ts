@@ -10,16 +10,310 @@ import {
   McpError
 } from '@modelcontextprotocol/sdk/types.js';
 import { MemoryManager } from './memory-manager.js';
-import { ServerOptions } from './types.js';
+import { ProjectContext, ServerOptions } from './types.js';
+
+// Shared by every string-list argument in the schemas below
+const STRING_ARRAY = { type: 'array', items: { type: 'string' } };
+
+// Tool definitions are static and shared by every server instance
+const TOOL_DEFINITIONS: Tool[] = [
+  {
+    name: 'get_project_context',
+    description: 'Get comprehensive current project context and status',
+    inputSchema: {
+      type: 'object',
+      properties: {},
+      required: []
+    }
+  },
+  {
+    name: 'update_implementation_status',
+    description: 'Update implementation status for a project component',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        component: {
+          type: 'string',
+          description: 'Name of the component (e.g., "frontend", "api", "database")'
+        },
+        status: {
+          type: 'string',
+          enum: ['not_started', 'in_progress', 'complete', 'blocked', 'deprecated'],
+          description: 'Current status of the component'
+        },
+        details: {
+          type: 'string',
+          description: 'Additional details about the status or progress'
+        },
+        progress: {
+          type: 'integer',
+          minimum: 0,
+          maximum: 100,
+          description: 'Progress percentage (0-100)'
+        }
+      },
+      required: ['component', 'status']
+    }
+  },
+  {
+    name: 'add_architecture_decision',
+    description: 'Record an architecture decision with rationale and impact',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        decision: {
+          type: 'string',
+          description: 'The architecture decision that was made'
+        },
+        rationale: {
+          type: 'string',
+          description: 'The reasoning behind this decision'
+        },
+        impact: {
+          type: 'string',
+          description: 'Expected impact or consequences of this decision'
+        },
+        alternatives: {
+          ...STRING_ARRAY,
+          description: 'Alternative approaches that were considered'
+        }
+      },
+      required: ['decision', 'rationale']
+    }
+  },
+  {
+    name: 'add_working_solution',
+    description: 'Record a working solution for a problem that can be referenced later',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        problem: {
+          type: 'string',
+          description: 'Description of the problem that was solved'
+        },
+        solution: {
+          type: 'string',
+          description: 'The working solution or approach'
+        },
+        command: {
+          type: 'string',
+          description: 'Command, code snippet, or exact steps to implement the solution'
+        },
+        tags: {
+          ...STRING_ARRAY,
+          description: 'Tags for categorizing this solution'
+        }
+      },
+      required: ['problem', 'solution']
+    }
+  },
+  {
+    name: 'update_priorities',
+    description: 'Update the current project priorities in order of importance',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        priorities: {
+          ...STRING_ARRAY,
+          description: 'List of current priorities in order of importance'
+        }
+      },
+      required: ['priorities']
+    }
+  },
+  {
+    name: 'search_memory',
+    description: 'Search through project memory for relevant information',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        query: {
+          type: 'string',
+          description: 'Search query to find relevant decisions, solutions, or conversations'
+        },
+        limit: {
+          type: 'integer',
+          default: 10,
+          minimum: 1,
+          maximum: 50,
+          description: 'Maximum number of results to return'
+        }
+      },
+      required: ['query']
+    }
+  },
+  {
+    name: 'log_conversation_context',
+    description: 'Log the context and outcomes from the current conversation',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        summary: {
+          type: 'string',
+          description: 'Summary of what was discussed or accomplished in this conversation'
+        },
+        decisions_made: {
+          ...STRING_ARRAY,
+          description: 'List of decisions made during this conversation'
+        },
+        solutions_found: {
+          ...STRING_ARRAY,
+          description: 'List of solutions discovered or implemented'
+        }
+      },
+      required: ['summary']
+    }
+  },
+  {
+    name: 'clear_memory',
+    description: 'Clear or reset project memory (with optional backup)',
+    inputSchema: {
+      type: 'object',
+      properties: {
+        scope: {
+          type: 'string',
+          enum: ['all', 'decisions', 'solutions', 'conversations', 'components'],
+          default: 'all',
+          description: 'What to clear: all memory, or specific sections'
+        },
+        create_backup: {
+          type: 'boolean',
+          default: true,
+          description: 'Whether to create a backup before clearing'
+        },
+        confirm: {
+          type: 'boolean',
+          default: false,
+          description: 'Confirmation flag - must be true to actually clear memory'
+        }
+      },
+      required: ['confirm']
+    }
+  }
+];
+
+// The list_tools response never changes, so it is handed out by reference
+const LIST_TOOLS_RESULT = { tools: TOOL_DEFINITIONS };
+
+// How long shutdown() waits for running tool calls
+const SHUTDOWN_TIMEOUT_MS = 5000;
+
+// Handlers that only read in-memory state stay synchronous
+type ToolHandler = (args: any) => CallToolResult | Promise<CallToolResult>;
+type ArgumentValidator = (args: any) => void;
+
+interface RegisteredTool {
+  handler: ToolHandler;
+  validate: ArgumentValidator;
+  defaults: Record<string, unknown>;
+}
+
+// Serialize a tool response payload; all handlers go through here so the
+// response encoding is defined in one place. TextContent.text must be a
+// string: the stdio transport serializes the whole JSON-RPC message itself,
+// so there is no byte-level path to hand it pre-encoded output
+function toJson(value: unknown): string {
+  return JSON.stringify(value, null, 2);
+}
+
+// Compiled validators keyed by the schema's JSON text, shared by every
+// server instance in the process
+const validatorCache = new Map<string, ArgumentValidator>();
+
+// Build the single text block result every tool returns
+function textResult(text: string): CallToolResult {
+  return { content: [{ type: 'text', text } as TextContent] };
+}
+
+function capitalize(name: string): string {
+  return name.charAt(0).toUpperCase() + name.slice(1);
+}
+
+// Turn a tool's input schema into a validator once, so each call only runs
+// the checks the schema actually declares instead of re-reading the schema
+function compileArgumentValidator(schema: Tool['inputSchema']): ArgumentValidator {
+  const required: string[] = (schema as any).required || [];
+  const checks: ArgumentValidator[] = [];
+
+  for (const [name, property] of Object.entries<any>(schema.properties ?? {})) {
+    const label = capitalize(name);
+    // Values and types of optional arguments are left to the handlers,
+    // which report them with their own messages
+    const isRequired = required.includes(name);
+
+    if (isRequired && Array.isArray(property.enum)) {
+      const allowed = new Set(property.enum);
+      checks.push((args) => {
+        if (args[name] && !allowed.has(args[name])) {
+          throw new Error(`Invalid ${name}: ${args[name]}`);
+        }
+      });
+    }
+    if (property.minimum !== undefined && property.maximum !== undefined) {
+      const { minimum, maximum } = property;
+      checks.push((args) => {
+        if (args[name] !== undefined && (args[name] < minimum || args[name] > maximum)) {
+          throw new Error(`${label} must be between ${minimum} and ${maximum}`);
+        }
+      });
+    }
+    if (isRequired && property.type === 'array') {
+      checks.push((args) => {
+        if (args[name] !== undefined && !Array.isArray(args[name])) {
+          throw new Error(`${label} must be an array`);
+        }
+      });
+    }
+  }
+
+  return (args) => {
+    for (const requiredProp of required) {
+      if (!(requiredProp in args)) {
+        throw new Error(`Missing required argument: ${requiredProp}`);
+      }
+    }
+    for (const check of checks) {
+      check(args);
+    }
+  };
+}
+
+// Collect the schema's declared defaults once so handlers receive complete
+// arguments instead of repeating the defaults inline
+function getSchemaDefaults(schema: Tool['inputSchema']): Record<string, unknown> {
+  const defaults: Record<string, unknown> = {};
+  for (const [name, property] of Object.entries<any>(schema.properties ?? {})) {
+    if (property.default !== undefined) {
+      defaults[name] = property.default;
+    }
+  }
+  return defaults;
+}
+
+function getArgumentValidator(schema: Tool['inputSchema']): ArgumentValidator {
+  const key = JSON.stringify(schema);
+  let validator = validatorCache.get(key);
+  if (!validator) {
+    validator = compileArgumentValidator(schema);
+    validatorCache.set(key, validator);
+  }
+  return validator;
+}
 
 export class ProjectMemoryServer {
-  private server: Server;
-  private memoryManager: MemoryManager;
-  private verbose: boolean;
+  private readonly server: Server;
+  private readonly memoryManager: MemoryManager;
+  private readonly verbose: boolean;
+  private readonly toolRegistry: Map<string, RegisteredTool>;
+  private readonly inFlight = new Set<Promise<CallToolResult>>();
+  private closing = false;
+  // Settles once project memory is loaded; tool calls wait on it
+  private ready: Promise<void> = Promise.resolve();
 
   constructor(options: ServerOptions) {
     this.verbose = options.verbose;
     this.memoryManager = new MemoryManager(options);
+    this.toolRegistry = this.buildToolRegistry();
     
     this.server = new Server(
       {
@@ -38,11 +332,7 @@ export class ProjectMemoryServer {
 
   private setupToolHandlers(): void {
     // List tools handler
-    this.server.setRequestHandler(ListToolsRequestSchema, async () => {
-      return {
-        tools: this.getToolDefinitions(),
-      };
-    });
+    this.server.setRequestHandler(ListToolsRequestSchema, async () => LIST_TOOLS_RESULT);
 
     // Call tool handler
     this.server.setRequestHandler(CallToolRequestSchema, async (request) => {
@@ -54,239 +344,76 @@ export class ProjectMemoryServer {
       }
     });
   }
+
   private getToolDefinitions(): Tool[] {
-    return [
-      {
-        name: 'get_project_context',
-        description: 'Get comprehensive current project context and status',
-        inputSchema: {
-          type: 'object',
-          properties: {},
-          required: []
-        }
-      },
-      {
-        name: 'update_implementation_status',
-        description: 'Update implementation status for a project component',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            component: {
-              type: 'string',
-              description: 'Name of the component (e.g., "frontend", "api", "database")'
-            },
-            status: {
-              type: 'string',
-              enum: ['not_started', 'in_progress', 'complete', 'blocked', 'deprecated'],
-              description: 'Current status of the component'
-            },
-            details: {
-              type: 'string',
-              description: 'Additional details about the status or progress'
-            },
-            progress: {
-              type: 'integer',
-              minimum: 0,
-              maximum: 100,
-              description: 'Progress percentage (0-100)'
-            }
-          },
-          required: ['component', 'status']
-        }
-      },
-      {
-        name: 'add_architecture_decision',
-        description: 'Record an architecture decision with rationale and impact',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            decision: {
-              type: 'string',
-              description: 'The architecture decision that was made'
-            },
-            rationale: {
-              type: 'string',
-              description: 'The reasoning behind this decision'
-            },
-            impact: {
-              type: 'string',
-              description: 'Expected impact or consequences of this decision'
-            },
-            alternatives: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'Alternative approaches that were considered'
-            }
-          },
-          required: ['decision', 'rationale']
-        }
-      }      ,
-      {
-        name: 'add_working_solution',
-        description: 'Record a working solution for a problem that can be referenced later',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            problem: {
-              type: 'string',
-              description: 'Description of the problem that was solved'
-            },
-            solution: {
-              type: 'string',
-              description: 'The working solution or approach'
-            },
-            command: {
-              type: 'string',
-              description: 'Command, code snippet, or exact steps to implement the solution'
-            },
-            tags: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'Tags for categorizing this solution'
-            }
-          },
-          required: ['problem', 'solution']
-        }
-      },
-      {
-        name: 'update_priorities',
-        description: 'Update the current project priorities in order of importance',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            priorities: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'List of current priorities in order of importance'
-            }
-          },
-          required: ['priorities']
-        }
-      },
-      {
-        name: 'search_memory',
-        description: 'Search through project memory for relevant information',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            query: {
-              type: 'string',
-              description: 'Search query to find relevant decisions, solutions, or conversations'
-            },
-            limit: {
-              type: 'integer',
-              default: 10,
-              minimum: 1,
-              maximum: 50,
-              description: 'Maximum number of results to return'
-            }
-          },
-          required: ['query']
-        }
-      },
-      {
-        name: 'log_conversation_context',
-        description: 'Log the context and outcomes from the current conversation',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            summary: {
-              type: 'string',
-              description: 'Summary of what was discussed or accomplished in this conversation'
-            },
-            decisions_made: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'List of decisions made during this conversation'
-            },
-            solutions_found: {
-              type: 'array',
-              items: { type: 'string' },
-              description: 'List of solutions discovered or implemented'
-            }
-          },
-          required: ['summary']
-        }
-      },
-      {
-        name: 'clear_memory',
-        description: 'Clear or reset project memory (with optional backup)',
-        inputSchema: {
-          type: 'object',
-          properties: {
-            scope: {
-              type: 'string',
-              enum: ['all', 'decisions', 'solutions', 'conversations', 'components'],
-              default: 'all',
-              description: 'What to clear: all memory, or specific sections'
-            },
-            create_backup: {
-              type: 'boolean',
-              default: true,
-              description: 'Whether to create a backup before clearing'
-            },
-            confirm: {
-              type: 'boolean',
-              default: false,
-              description: 'Confirmation flag - must be true to actually clear memory'
-            }
-          },
-          required: ['confirm']
+    return TOOL_DEFINITIONS;
+  }
+
+  private buildToolRegistry(): Map<string, RegisteredTool> {
+    const handlers: Record<string, ToolHandler> = {
+      get_project_context: () => this.handleGetProjectContext(),
+      update_implementation_status: (args) => this.handleUpdateImplementationStatus(args),
+      add_architecture_decision: (args) => this.handleAddArchitectureDecision(args),
+      add_working_solution: (args) => this.handleAddWorkingSolution(args),
+      update_priorities: (args) => this.handleUpdatePriorities(args),
+      search_memory: (args) => this.handleSearchMemory(args),
+      log_conversation_context: (args) => this.handleLogConversationContext(args),
+      clear_memory: (args) => this.handleClearMemory(args)
+    };
+
+    // One entry per tool holds everything a call needs, so dispatch,
+    // validation and defaults resolve with a single lookup
+    return new Map(
+      TOOL_DEFINITIONS.map((tool): [string, RegisteredTool] => [
+        tool.name,
+        {
+          handler: handlers[tool.name],
+          validate: getArgumentValidator(tool.inputSchema),
+          defaults: getSchemaDefaults(tool.inputSchema)
         }
-      }
-    ];
+      ])
+    );
   }
+
   private async handleToolCall(name: string, args: any): Promise<CallToolResult> {
+    // Tracked so shutdown() can let running calls finish
+    const call = this.dispatchToolCall(name, args);
+    this.inFlight.add(call);
+    try {
+      return await call;
+    } finally {
+      this.inFlight.delete(call);
+    }
+  }
+
+  private async dispatchToolCall(name: string, args: any): Promise<CallToolResult> {
     if (this.verbose) {
       console.error(`🔧 Tool called: ${name}`);
     }
 
     try {
-      switch (name) {
-        case 'get_project_context':
-          return await this.handleGetProjectContext();
-        
-        case 'update_implementation_status':
-          return await this.handleUpdateImplementationStatus(args);
-        
-        case 'add_architecture_decision':
-          return await this.handleAddArchitectureDecision(args);
-        
-        case 'add_working_solution':
-          return await this.handleAddWorkingSolution(args);
-        
-        case 'update_priorities':
-          return await this.handleUpdatePriorities(args);
-        
-        case 'search_memory':
-          return await this.handleSearchMemory(args);
-        
-        case 'log_conversation_context':
-          return await this.handleLogConversationContext(args);
-        
-        case 'clear_memory':
-          return await this.handleClearMemory(args);
-        
-        default:
-          throw new Error(`Unknown tool: ${name}`);
+      if (this.closing) {
+        throw new Error('Server is shutting down');
       }
+      await this.ready;
+      const tool = this.validateToolArguments(name, args);
+      return await tool.handler({ ...tool.defaults, ...args });
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : String(error);
-      return {
-        content: [
-          {
-            type: 'text',
-            text: `Error executing ${name}: ${errorMessage}`
-          } as TextContent
-        ]
-      };
+      return textResult(`Error executing ${name}: ${errorMessage}`);
     }
   }
 
-  private async handleGetProjectContext(): Promise<CallToolResult> {
+  private handleGetProjectContext(): CallToolResult {
     const context = this.memoryManager.getCurrentContext();
-    
-    const formattedContext = {
+
+    return textResult(toJson(this.formatProjectContext(context)));
+  }
+
+  // The formatted view only references the arrays and maps already held in
+  // memory, so nothing is copied before the single serialization pass
+  private formatProjectContext(context: ProjectContext) {
+    return {
       project_overview: {
         name: context.project_name,
         type: context.project_type,
@@ -309,15 +436,6 @@ export class ProjectMemoryServer {
       working_solutions: context.solutions,
       last_updated: context.last_updated
     };
-
-    return {
-      content: [
-        {
-          type: 'text',
-          text: JSON.stringify(formattedContext, null, 2)
-        } as TextContent
-      ]
-    };
   }
   private async handleUpdateImplementationStatus(args: any): Promise<CallToolResult> {
     const { component, status, details, progress } = args;
@@ -329,14 +447,7 @@ export class ProjectMemoryServer {
       progress
     );
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: `Successfully updated ${component} status to ${status}${progress !== undefined ? ` (${progress}%)` : ''}`
-        } as TextContent
-      ]
-    };
+    return textResult(`Successfully updated ${component} status to ${status}${progress !== undefined ? ` (${progress}%)` : ''}`);
   }
 
   private async handleAddArchitectureDecision(args: any): Promise<CallToolResult> {
@@ -349,14 +460,7 @@ export class ProjectMemoryServer {
       alternatives
     );
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: `Successfully recorded architecture decision: ${decision}`
-        } as TextContent
-      ]
-    };
+    return textResult(`Successfully recorded architecture decision: ${decision}`);
   }
 
   private async handleAddWorkingSolution(args: any): Promise<CallToolResult> {
@@ -369,14 +473,7 @@ export class ProjectMemoryServer {
       tags
     );
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: `Successfully recorded working solution for: ${problem}`
-        } as TextContent
-      ]
-    };
+    return textResult(`Successfully recorded working solution for: ${problem}`);
   }
 
   private async handleUpdatePriorities(args: any): Promise<CallToolResult> {
@@ -384,36 +481,18 @@ export class ProjectMemoryServer {
     
     await this.memoryManager.updatePriorities(priorities);
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: `Successfully updated priorities (${priorities.length} items)`
-        } as TextContent
-      ]
-    };
+    return textResult(`Successfully updated priorities (${priorities.length} items)`);
   }
-  private async handleSearchMemory(args: any): Promise<CallToolResult> {
-    const { query, limit = 10 } = args;
+  private handleSearchMemory(args: any): CallToolResult {
+    const { query, limit } = args;
     
     const results = this.memoryManager.searchMemory(query, limit);
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: JSON.stringify({
-            query,
-            results_count: results.length,
-            results: results.map(r => ({
-              type: r.type,
-              relevance: r.relevance,
-              content: r.data
-            }))
-          }, null, 2)
-        } as TextContent
-      ]
-    };
+    return textResult(toJson({
+      query,
+      results_count: results.length,
+      results
+    }));
   }
 
   private async handleLogConversationContext(args: any): Promise<CallToolResult> {
@@ -425,40 +504,19 @@ export class ProjectMemoryServer {
       solutions_found
     );
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: `Successfully logged conversation context: ${summary}`
-        } as TextContent
-      ]
-    };
+    return textResult(`Successfully logged conversation context: ${summary}`);
   }
 
   private async handleClearMemory(args: any): Promise<CallToolResult> {
-    const { scope = 'all', create_backup = true, confirm = false } = args;
+    const { scope, create_backup, confirm } = args;
     
     if (!confirm) {
-      return {
-        content: [
-          {
-            type: 'text',
-            text: `⚠️ Memory clear operation requires confirmation. Call again with confirm: true to proceed.\n\nThis will clear: ${scope}\nBackup will be created: ${create_backup}`
-          } as TextContent
-        ]
-      };
+      return textResult(`⚠️ Memory clear operation requires confirmation. Call again with confirm: true to proceed.\n\nThis will clear: ${scope}\nBackup will be created: ${create_backup}`);
     }
     
     const result = await this.memoryManager.clearMemory(scope, create_backup);
 
-    return {
-      content: [
-        {
-          type: 'text',
-          text: result
-        } as TextContent
-      ]
-    };
+    return textResult(result);
   }
 
   private formatSearchResults(results: any[]): string {
@@ -471,81 +529,94 @@ export class ProjectMemoryServer {
       const separator = '-'.repeat(header.length);
       let content = '';
 
-      if (typeof result.data === 'string') {
-        content = result.data;
-      } else if (typeof result.data === 'object') {
-        content = JSON.stringify(result.data, null, 2);
+      if (typeof result.content === 'string') {
+        content = result.content;
+      } else if (typeof result.content === 'object') {
+        content = toJson(result.content);
       } else {
-        content = String(result.data);
+        content = String(result.content);
       }
 
       return `${header}\n${separator}\n${content}\n`;
     }).join('\n');
   }
 
-  private validateToolArguments(toolName: string, args: any): void {
-    const tools = this.getToolDefinitions();
-    const tool = tools.find(t => t.name === toolName);
-    
+  // Resolve the tool and check its arguments, returning the registry entry
+  // so the caller can dispatch without a second lookup
+  private validateToolArguments(toolName: string, args: any): RegisteredTool {
+    const tool = this.toolRegistry.get(toolName);
+
     if (!tool) {
       throw new Error(`Unknown tool: ${toolName}`);
     }
 
-    const schema = tool.inputSchema;
-    const required = schema.properties ? (schema as any).required || [] : [];
+    tool.validate(args ?? {});
+    return tool;
+  }
 
-    // Check required properties
-    for (const requiredProp of required) {
-      if (!(requiredProp in args)) {
-        throw new Error(`Missing required argument: ${requiredProp}`);
-      }
-    }
+  // Load project memory. start() does this itself; callers embedding the
+  // server in-process use it before calling callTool()
+  async initialize(): Promise<void> {
+    this.ready = this.memoryManager.initialize();
+    await this.ready;
+  }
 
-    // Validate specific tool arguments
-    switch (toolName) {
-      case 'update_implementation_status':
-        if (args.status && !['not_started', 'in_progress', 'complete', 'blocked', 'deprecated'].includes(args.status)) {
-          throw new Error(`Invalid status: ${args.status}`);
-        }
-        if (args.progress !== undefined && (args.progress < 0 || args.progress > 100)) {
-          throw new Error('Progress must be between 0 and 100');
-        }
-        break;
-      
-      case 'search_memory':
-        if (args.limit !== undefined && (args.limit < 1 || args.limit > 50)) {
-          throw new Error('Limit must be between 1 and 50');
-        }
-        break;
-      
-      case 'update_priorities':
-        if (!Array.isArray(args.priorities)) {
-          throw new Error('Priorities must be an array');
-        }
-        break;
-    }
+  // In-process entry point: runs a tool exactly as a stdio call would,
+  // without the JSON-RPC framing and transport round trip
+  async callTool(name: string, args: Record<string, unknown> = {}): Promise<CallToolResult> {
+    return this.handleToolCall(name, args);
   }
 
   async start(): Promise<void> {
-    // Initialize memory manager
-    await this.memoryManager.initialize();
+    // Memory loads while the transport connects and the client completes
+    // its handshake; tool calls that arrive early wait for it to finish
+    const loading = this.initialize();
 
     if (this.verbose) {
-      console.error('🚀 Starting MCP server...');
-      console.error('Tools available:');
-      const tools = this.getToolDefinitions();
-      for (const tool of tools) {
-        console.error(`  • ${tool.name} - ${tool.description}`);
-      }
-      console.error('');
+      console.error([
+        '🚀 Starting MCP server...',
+        'Tools available:',
+        ...this.getToolDefinitions().map(tool => `  • ${tool.name} - ${tool.description}`),
+        ''
+      ].join('\n'));
     }
 
     // Create transport and run server
     const transport = new StdioServerTransport();
-    await this.server.connect(transport);
+    const [connected, loaded] = await Promise.allSettled([this.server.connect(transport), loading]);
+    if (loaded.status === 'rejected') {
+      // Every tool call would fail with the load error, so do not stay connected
+      if (connected.status === 'fulfilled') {
+        await this.server.close();
+      }
+      throw loaded.reason;
+    }
+    if (connected.status === 'rejected') {
+      throw connected.reason;
+    }
 
     if (this.verbose) {
       console.error('✅ MCP server started successfully!');
     }
   }
+
+  // Stop taking tool calls, give the ones already running up to timeoutMs
+  // to finish, flush pending memory writes and close the transport
+  async shutdown(timeoutMs: number = SHUTDOWN_TIMEOUT_MS): Promise<void> {
+    this.closing = true;
+
+    let timer: NodeJS.Timeout | undefined;
+    const timeout = new Promise<void>(resolve => {
+      timer = setTimeout(resolve, timeoutMs);
+    });
+    await Promise.race([Promise.allSettled(this.inFlight), timeout]);
+    clearTimeout(timer);
+
+    await this.memoryManager.flush();
+    await this.server.close();
+
+    if (this.verbose) {
+      console.error('👋 MCP server stopped');
+    }
+  }
 }
\ No newline at end of file
@@ -41,6 +41,12 @@ export interface ConversationContext {
   date: string;
 }
 
+export interface SearchResult {
+  type: 'decision' | 'solution' | 'conversation';
+  relevance: number;
+  content: ArchitectureDecision | WorkingSolution | ConversationContext;
+}
+
 export interface ProjectMemory {
   project_info: ProjectInfo;
   implementation_status: {
@@ -58,9 +64,22 @@ export interface ProjectMemory {
     version: string;
     created_at: string;
     last_updated: string;
+    journal_sequence?: number;
   };
 }
 
+export type MemoryChange =
+  | { type: 'component_status'; component: string; status: ComponentStatus }
+  | { type: 'architecture_decision'; decision: ArchitectureDecision }
+  | { type: 'working_solution'; solution: WorkingSolution }
+  | { type: 'priorities'; priorities: string[] }
+  | { type: 'conversation'; conversation: ConversationContext };
+
+export type JournalEntry = MemoryChange & {
+  seq: number;
+  timestamp: string;
+};
+
 export interface ProjectContext {
   project_name: string;
   project_type: string;
@@ -89,4 +108,5 @@ export interface ServerConfig {
   backup_interval: number;
   compression_enabled: boolean;
   auto_detect_project_type: boolean;
+  journal_snapshot_threshold: number;
 }
\ No newline at end of file
@@ -6,14 +6,21 @@ import { ServerOptions, ProjectMemory } from '../src/types.js';
 // Create mock implementations
 const mockFs = {
   ensureDir: jest.fn().mockResolvedValue(undefined),
-  readFile: jest.fn(),
+  readFile: jest.fn().mockResolvedValue(''),
   writeFile: jest.fn().mockResolvedValue(undefined),
+  open: jest.fn().mockResolvedValue(3),
+  fdatasync: jest.fn().mockResolvedValue(undefined),
+  close: jest.fn().mockResolvedValue(undefined),
+  rename: jest.fn().mockResolvedValue(undefined),
   pathExists: jest.fn(),
   readJSON: jest.fn(),
   writeJSON: jest.fn().mockResolvedValue(undefined),
   readJson: jest.fn(),
   writeJson: jest.fn().mockResolvedValue(undefined),
   readdir: jest.fn().mockResolvedValue([]),
+  appendFile: jest.fn().mockResolvedValue(undefined),
+  copyFile: jest.fn().mockResolvedValue(undefined),
+  remove: jest.fn().mockResolvedValue(undefined),
   existsSync: jest.fn().mockReturnValue(true),
 };
 
@@ -308,7 +315,7 @@ describe('MemoryManager - Comprehensive Tests', () => {
         const result = results[0];
         expect(result).toHaveProperty('type');
         expect(result).toHaveProperty('relevance');
-        expect(result).toHaveProperty('data');
+        expect(result).toHaveProperty('content');
         expect(typeof result.relevance).toBe('number');
       }
     });
@@ -8,12 +8,20 @@ const mockFs = {
   ensureDir: jest.fn().mockResolvedValue(undefined),
   readFile: jest.fn(),
   writeFile: jest.fn().mockResolvedValue(undefined),
+  open: jest.fn().mockResolvedValue(3),
+  fdatasync: jest.fn().mockResolvedValue(undefined),
+  close: jest.fn().mockResolvedValue(undefined),
+  rename: jest.fn().mockResolvedValue(undefined),
   pathExists: jest.fn().mockResolvedValue(true),
   readJSON: jest.fn(),
   writeJSON: jest.fn().mockResolvedValue(undefined),
   readJson: jest.fn(),
   writeJson: jest.fn().mockResolvedValue(undefined),
   readdir: jest.fn().mockResolvedValue([]),
+  readdirSync: jest.fn().mockReturnValue([]),
+  appendFile: jest.fn().mockResolvedValue(undefined),
+  copyFile: jest.fn().mockResolvedValue(undefined),
+  remove: jest.fn().mockResolvedValue(undefined),
   existsSync: jest.fn().mockReturnValue(true),
 };
 
@@ -99,6 +107,16 @@ describe('MemoryManager', () => {
       );
     });
 
+    test('should detect the project type from a single directory listing', async () => {
+      mockFs.readdirSync.mockReturnValueOnce(['README.md', 'Cargo.toml']);
+
+      await memoryManager.initialize();
+      await memoryManager.clearMemory('all', false);
+
+      expect(memoryManager.getCurrentContext().project_type).toBe('Rust');
+      expect(mockFs.readdirSync).toHaveBeenCalledTimes(1);
+    });
+
     test('should create new memory when file does not exist', async () => {
       mockFs.pathExists.mockResolvedValue(false);
       
@@ -250,6 +268,243 @@ describe('MemoryManager', () => {
     });
   });
 
+  describe('counters', () => {
+    beforeEach(async () => {
+      await memoryManager.initialize();
+    });
+
+    test('should count entries without building the context', async () => {
+      const contextSpy = jest.spyOn(memoryManager, 'getCurrentContext');
+      await memoryManager.addArchitectureDecision('Use TypeScript', 'Type safety');
+      await memoryManager.updateImplementationStatus('api', 'in_progress');
+      contextSpy.mockClear();
+
+      expect(memoryManager.getDecisionCount()).toBe(1);
+      expect(memoryManager.getComponentCount()).toBe(1);
+      expect(memoryManager.getSolutionCount()).toBe(0);
+      expect(memoryManager.getConversationCount()).toBe(0);
+      expect(contextSpy).not.toHaveBeenCalled();
+    });
+
+    test('should keep counts in step with updates and clears', async () => {
+      await memoryManager.updateImplementationStatus('api', 'in_progress');
+      await memoryManager.updateImplementationStatus('api', 'complete');
+      await memoryManager.addWorkingSolution('Flaky build', 'Pin the toolchain');
+      expect(memoryManager.getComponentCount()).toBe(1);
+      expect(memoryManager.getSolutionCount()).toBe(1);
+
+      await memoryManager.clearMemory('components', false);
+      expect(memoryManager.getComponentCount()).toBe(0);
+      expect(memoryManager.getSolutionCount()).toBe(1);
+    });
+  });
+
+  describe('journal', () => {
+    test('should append changes to the journal instead of rewriting memory', async () => {
+      await memoryManager.initialize();
+      await memoryManager.updatePriorities(['Ship the release']);
+
+      expect(mockFs.appendFile).toHaveBeenCalledWith(
+        path.join(path.resolve('/test/project'), '.project_memory', 'journal.jsonl'),
+        expect.stringContaining('"type":"priorities"')
+      );
+      expect(mockFs.writeJson).not.toHaveBeenCalled();
+    });
+
+    test('should append concurrent changes one at a time in sequence order', async () => {
+      await memoryManager.initialize();
+      let finishFirstAppend!: () => void;
+      mockFs.appendFile.mockImplementationOnce(() => new Promise<void>(resolve => { finishFirstAppend = resolve; }));
+
+      const first = memoryManager.updatePriorities(['First']);
+      const second = memoryManager.updatePriorities(['Second']);
+      await Promise.resolve();
+      expect(mockFs.appendFile).toHaveBeenCalledTimes(1);
+
+      finishFirstAppend();
+      await Promise.all([first, second]);
+
+      const sequences = mockFs.appendFile.mock.calls.map(call => JSON.parse(call[1] as string).seq);
+      expect(sequences).toEqual([1, 2]);
+    });
+
+    test('should stamp the record and its journal entry with the same time', async () => {
+      await memoryManager.initialize();
+      await memoryManager.addArchitectureDecision('Use Redis', 'Caching');
+
+      const [decision] = memoryManager.getCurrentContext().recent_decisions;
+      expect(memoryManager.getCurrentContext().last_updated).toBe(decision.date);
+    });
+
+    test('should coalesce context file writes between snapshots', async () => {
+      jest.useFakeTimers();
+      try {
+        await memoryManager.initialize();
+        await memoryManager.updatePriorities(['First']);
+        await memoryManager.updatePriorities(['Second']);
+        expect(mockFs.writeJson).not.toHaveBeenCalled();
+
+        // The timer queues the write, so let the queue drain as well
+        await jest.advanceTimersByTimeAsync(1000);
+
+        expect(mockFs.writeJson).toHaveBeenCalledTimes(1);
+        expect(mockFs.writeJson).toHaveBeenCalledWith(
+          path.join(path.resolve('/test/project'), '.project_memory', 'current_context.json'),
+          expect.objectContaining({ priorities: ['Second'] }),
+          { spaces: 2 }
+        );
+      } finally {
+        jest.useRealTimers();
+      }
+    });
+
+    test('should write a pending context file on flush', async () => {
+      jest.useFakeTimers();
+      try {
+        await memoryManager.initialize();
+        await memoryManager.updatePriorities(['Pending']);
+
+        await memoryManager.flush();
+        expect(mockFs.writeJson).toHaveBeenCalledTimes(1);
+        expect(mockFs.writeJson).toHaveBeenCalledWith(
+          expect.stringContaining('current_context.json'),
+          expect.objectContaining({ priorities: ['Pending'] }),
+          { spaces: 2 }
+        );
+
+        // The timer was cancelled, so nothing is written twice
+        await jest.advanceTimersByTimeAsync(1000);
+        expect(mockFs.writeJson).toHaveBeenCalledTimes(1);
+      } finally {
+        jest.useRealTimers();
+      }
+    });
+
+    test('should sync the journal once on flush', async () => {
+      await memoryManager.initialize();
+      mockFs.fdatasync.mockClear();
+      mockFs.close.mockClear();
+      await memoryManager.updatePriorities(['Durable']);
+      await memoryManager.flush();
+      await memoryManager.flush();
+
+      const journalFile = path.join(path.resolve('/test/project'), '.project_memory', 'journal.jsonl');
+      const journalOpens = mockFs.open.mock.calls.filter(call => call[0] === journalFile);
+      expect(journalOpens).toEqual([[journalFile, 'a']]);
+      expect(mockFs.fdatasync).toHaveBeenCalledTimes(1);
+      expect(mockFs.close).toHaveBeenCalledTimes(1);
+    });
+
+    test('should write snapshots to a temporary file and rename it into place', async () => {
+      await memoryManager.initialize();
+      await memoryManager.saveMemory();
+
+      const memoryFile = path.join(path.resolve('/test/project'), '.project_memory', 'project_memory.json');
+      expect(mockFs.open).toHaveBeenCalledWith(`${memoryFile}.tmp`, 'w');
+      expect(mockFs.fdatasync).toHaveBeenCalled();
+      expect(mockFs.rename).toHaveBeenCalledWith(`${memoryFile}.tmp`, memoryFile);
+    });
+
+    test('should serialize memory the same way JSON.stringify does', async () => {
+      await memoryManager.initialize();
+      await memoryManager.addArchitectureDecision('Use Redis', 'Caching');
+      await memoryManager.addWorkingSolution('Slow build', 'Enable caching', undefined, ['ci']);
+      await memoryManager.logConversationContext('Planned the release');
+
+      expect(memoryManager['serializeMemory']()).toBe(JSON.stringify(memoryManager['memory']));
+    });
+
+    test('should not store the caller\'s arrays in encoded records', async () => {
+      await memoryManager.initialize();
+      const alternatives = ['Memcached'];
+      const tags = ['ci'];
+      const decisions = ['Use Redis'];
+      await memoryManager.addArchitectureDecision('Use Redis', 'Caching', undefined, alternatives);
+      await memoryManager.addWorkingSolution('Slow build', 'Enable caching', undefined, tags);
+      await memoryManager.logConversationContext('Planned the release', decisions);
+      memoryManager['serializeMemory']();
+
+      alternatives.push('Valkey');
+      tags.push('build');
+      decisions.push('Drop Redis');
+
+      const snapshot = JSON.parse(memoryManager['serializeMemory']());
+      expect(snapshot).toEqual(JSON.parse(JSON.stringify(memoryManager['memory'])));
+      expect(snapshot.architecture.decisions[0].alternatives).toEqual(['Memcached']);
+    });
+
+    test('should reuse the encoding of records that were already written', async () => {
+      await memoryManager.initialize();
+      await memoryManager.addArchitectureDecision('Use Redis', 'Caching');
+      memoryManager['serializeMemory']();
+
+      const [decision] = memoryManager['memory'].architecture.decisions;
+      expect(memoryManager['encodedRecords'].get(decision)).toBe(JSON.stringify(decision));
+    });
+
+    test('should back up a snapshot by copying the memory file', async () => {
+      await memoryManager.initialize();
+      await memoryManager.saveMemory();
+
+      const memoryFile = path.join(path.resolve('/test/project'), '.project_memory', 'project_memory.json');
+      expect(mockFs.copyFile).toHaveBeenCalledWith(memoryFile, expect.stringContaining('memory_backup_'));
+    });
+
+    test('should replay journal entries on initialize', async () => {
+      mockFs.pathExists.mockImplementation(async (file: any) => file.endsWith('journal.jsonl'));
+      mockFs.readFile.mockResolvedValue(
+        `${JSON.stringify({ type: 'priorities', priorities: ['Replayed'], seq: 1, timestamp: '2024-01-02T00:00:00Z' })}\n`
+      );
+
+      await memoryManager.initialize();
+
+      expect(memoryManager.getCurrentContext().priorities).toEqual(['Replayed']);
+      expect(memoryManager.getCurrentContext().last_updated).toBe('2024-01-02T00:00:00Z');
+    });
+  });
+
+  describe('backups', () => {
+    beforeEach(async () => {
+      await memoryManager.initialize();
+    });
+
+    test('should not back up again within the backup interval', async () => {
+      await memoryManager.saveMemory();
+      await memoryManager.saveMemory();
+
+      expect(mockFs.copyFile).toHaveBeenCalledTimes(1);
+      expect(mockFs.readdir).toHaveBeenCalledTimes(1);
+    });
+
+    test('should queue clearMemory backups behind a pending snapshot', async () => {
+      let finishListing!: (files: string[]) => void;
+      mockFs.readdir.mockImplementationOnce(() => new Promise<string[]>(resolve => { finishListing = resolve; }));
+
+      const saved = memoryManager.saveMemory();
+      const cleared = memoryManager.clearMemory('decisions', true);
+      await new Promise(resolve => setImmediate(resolve));
+      expect(mockFs.readdir).toHaveBeenCalledTimes(1);
+
+      finishListing([]);
+      await Promise.all([saved, cleared]);
+
+      expect(mockFs.readdir).toHaveBeenCalledTimes(1);
+      expect(mockFs.copyFile).toHaveBeenCalledTimes(1);
+      expect(mockFs.writeFile).toHaveBeenCalledWith(expect.stringContaining('memory_backup_'), expect.any(String));
+    });
+
+    test('should prune the oldest backups without listing the directory again', async () => {
+      const existing = Array.from({ length: 10 }, (_, i) => `memory_backup_2024-01-${String(i + 1).padStart(2, '0')}.json`);
+      mockFs.readdir.mockResolvedValueOnce(existing);
+
+      await memoryManager.clearMemory('decisions', true);
+
+      const backupDir = path.join(path.resolve('/test/project'), '.project_memory', 'backups');
+      expect(mockFs.remove).toHaveBeenCalledWith(path.join(backupDir, existing[0]));
+      expect(mockFs.readdir).toHaveBeenCalledTimes(1);
+    });
+  });
+
   describe('updatePriorities', () => {
     beforeEach(async () => {
       await memoryManager.initialize();
@@ -292,6 +547,19 @@ describe('MemoryManager', () => {
       
       expect(mockFs.writeJSON).toHaveBeenCalled();
     });
+
+    test('should keep only the most recent conversations', async () => {
+      memoryManager['config'].max_conversation_history = 2;
+      const history = memoryManager['memory'].conversations;
+
+      await memoryManager.logConversationContext('First');
+      await memoryManager.logConversationContext('Second');
+      await memoryManager.logConversationContext('Third');
+
+      expect(memoryManager['memory'].conversations).toBe(history);
+      expect(history.map(conversation => conversation.summary)).toEqual(['Second', 'Third']);
+      expect(memoryManager.searchMemory('First')).toEqual([]);
+    });
   });
 
   describe('clearMemory', () => {
@@ -319,5 +587,13 @@ describe('MemoryManager', () => {
       expect(result).toContain('cleared');
       expect(mockFs.writeJSON).toHaveBeenCalled();
     });
+
+    test('should keep changes made while the clear is still being written', async () => {
+      const cleared = memoryManager.clearMemory('all', false);
+      const updated = memoryManager.updateImplementationStatus('frontend', 'in_progress');
+      await Promise.all([cleared, updated]);
+
+      expect(memoryManager.getCurrentContext().components.frontend.status).toBe('in_progress');
+    });
   });
 });
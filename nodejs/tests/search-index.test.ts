@@ -0,0 +1,71 @@
+import { describe, test, expect, beforeEach } from '@jest/globals';
+import { SearchIndex } from '../src/search-index.js';
+import { ArchitectureDecision, ConversationContext, WorkingSolution } from '../src/types.js';
+
+describe('SearchIndex', () => {
+  let index: SearchIndex;
+
+  const decision: ArchitectureDecision = {
+    id: 'dec1',
+    decision: 'Use React for frontend',
+    rationale: 'Component-based architecture',
+    date: '2024-01-01T00:00:00Z'
+  };
+
+  const solution: WorkingSolution = {
+    id: 'sol1',
+    problem: 'How to handle React state',
+    solution: 'Use useState hook',
+    date: '2024-01-01T00:00:00Z',
+    successCount: 1
+  };
+
+  const conversation: ConversationContext = {
+    id: 'conv1',
+    summary: 'Discussed database migrations',
+    date: '2024-01-01T00:00:00Z'
+  };
+
+  beforeEach(() => {
+    index = new SearchIndex();
+    index.add('conversation', conversation, [conversation.summary], conversation.summary);
+    index.add('solution', solution, [solution.problem, solution.solution], `${solution.problem} ${solution.solution}`);
+    index.add('decision', decision, [decision.decision, decision.rationale], `${decision.decision} ${decision.rationale}`);
+  });
+
+  test('should return records containing every query trigram', () => {
+    const candidates = index.candidates('react');
+    expect(candidates.map(record => record.content)).toEqual([decision, solution]);
+  });
+
+  test('should return nothing when a query trigram is unknown', () => {
+    expect(index.candidates('kubernetes')).toEqual([]);
+  });
+
+  test('should fall back to every record for short queries', () => {
+    expect(index.candidates('us').map(record => record.type)).toEqual(['decision', 'solution', 'conversation']);
+  });
+
+  test('should lowercase indexed fields', () => {
+    const [record] = index.candidates('component');
+    expect(record.fields).toContain('component-based architecture');
+  });
+
+  test('should precompute the lowercased relevance text and words', () => {
+    const [record] = index.candidates('migrations');
+    expect(record.textLower).toBe('discussed database migrations');
+    expect(record.textWords).toEqual(['discussed', 'database', 'migrations']);
+  });
+
+  test('should forget removed records', () => {
+    index.remove(solution);
+    expect(index.candidates('react').map(record => record.content)).toEqual([decision]);
+    expect(index.candidates('usestate')).toEqual([]);
+  });
+
+  test('should drop everything on clear', () => {
+    index.clear();
+    expect(index.candidates('react')).toEqual([]);
+    expect(index.candidates('')).toEqual([]);
+  });
+});
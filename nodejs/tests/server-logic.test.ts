@@ -83,6 +83,13 @@ describe('ProjectMemoryServer - Logic Tests', () => {
       });
     });
 
+    test('should share tool definitions across calls and instances', () => {
+      const server = new ProjectMemoryServer(options);
+      const other = new ProjectMemoryServer(options);
+      expect(server['getToolDefinitions']()).toBe(server['getToolDefinitions']());
+      expect(other['getToolDefinitions']()).toBe(server['getToolDefinitions']());
+    });
+
     test('should have proper input schemas', () => {
       const server = new ProjectMemoryServer(options);
       const tools = server['getToolDefinitions']();
@@ -116,7 +123,7 @@ describe('ProjectMemoryServer - Logic Tests', () => {
       const results = [{
         type: 'decision',
         relevance: 0.8,
-        data: 'Test decision content'
+        content: 'Test decision content'
       }];
       
       const formatted = server['formatSearchResults'](results);
@@ -129,9 +136,9 @@ describe('ProjectMemoryServer - Logic Tests', () => {
 
     test('should format multiple results', () => {
       const results = [
-        { type: 'decision', relevance: 0.9, data: 'Decision 1' },
-        { type: 'solution', relevance: 0.7, data: 'Solution 1' },
-        { type: 'conversation', relevance: 0.6, data: 'Conversation 1' }
+        { type: 'decision', relevance: 0.9, content: 'Decision 1' },
+        { type: 'solution', relevance: 0.7, content: 'Solution 1' },
+        { type: 'conversation', relevance: 0.6, content: 'Conversation 1' }
       ];
       
       const formatted = server['formatSearchResults'](results);
@@ -147,7 +154,7 @@ describe('ProjectMemoryServer - Logic Tests', () => {
       const results = [{
         type: 'decision',
         relevance: 0.8,
-        data: { 
+        content: { 
           decision: 'Use TypeScript', 
           rationale: 'Better type safety',
           impact: 'Improved code quality'
@@ -164,7 +171,7 @@ describe('ProjectMemoryServer - Logic Tests', () => {
       const results = [{
         type: 'solution',
         relevance: 0.7,
-        data: 'Simple string solution'
+        content: 'Simple string solution'
       }];
       
       const formatted = server['formatSearchResults'](results);
@@ -175,7 +182,7 @@ describe('ProjectMemoryServer - Logic Tests', () => {
       const results = [{
         type: 'test',
         relevance: 0.5,
-        data: 12345
+        content: 12345
       }];
       
       const formatted = server['formatSearchResults'](results);
@@ -184,8 +191,8 @@ describe('ProjectMemoryServer - Logic Tests', () => {
 
     test('should handle null or undefined data', () => {
       const results = [
-        { type: 'test1', relevance: 0.5, data: null },
-        { type: 'test2', relevance: 0.4, data: undefined }
+        { type: 'test1', relevance: 0.5, content: null },
+        { type: 'test2', relevance: 0.4, content: undefined }
       ];
       
       const formatted = server['formatSearchResults'](results);
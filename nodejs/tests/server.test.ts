@@ -8,6 +8,7 @@ jest.mock('@modelcontextprotocol/sdk/server/index.js', () => ({
     setRequestHandler: jest.fn(),
     notification: jest.fn(),
     connect: jest.fn(),
+    close: jest.fn(),
   })),
 }));
 
@@ -48,6 +49,142 @@ describe('ProjectMemoryServer', () => {
     });
   });
 
+  describe('list_tools handler', () => {
+    test('should return the same prebuilt result on every call', async () => {
+      const setRequestHandler = server['server'].setRequestHandler as jest.Mock<any>;
+      const listTools = setRequestHandler.mock.calls[0][1] as () => Promise<any>;
+
+      const first = await listTools();
+      expect(await listTools()).toBe(first);
+      expect(first.tools).toBe(server['getToolDefinitions']());
+    });
+  });
+
+  describe('handleToolCall', () => {
+    test('should return an error result for unknown tools', async () => {
+      const result = await server['handleToolCall']('unknown_tool', {});
+      expect((result.content[0] as any).text).toBe('Error executing unknown_tool: Unknown tool: unknown_tool');
+    });
+
+    test('should validate arguments before dispatching', async () => {
+      const result = await server['handleToolCall']('search_memory', { query: 'test', limit: 100 });
+      expect((result.content[0] as any).text).toBe('Error executing search_memory: Limit must be between 1 and 50');
+    });
+
+    test('should apply schema defaults before dispatching', async () => {
+      const result = await server['handleToolCall']('clear_memory', { confirm: false });
+      const text = (result.content[0] as any).text;
+      expect(text).toContain('This will clear: all');
+      expect(text).toContain('Backup will be created: true');
+    });
+
+    test('should share compiled validators between server instances', () => {
+      const other = new ProjectMemoryServer(options);
+      expect(other['toolRegistry'].get('search_memory')!.validate).toBe(server['toolRegistry'].get('search_memory')!.validate);
+    });
+
+    test('should register a handler for every tool definition', () => {
+      for (const tool of server['getToolDefinitions']()) {
+        expect(typeof server['toolRegistry'].get(tool.name)!.handler).toBe('function');
+      }
+    });
+  });
+
+  describe('callTool', () => {
+    test('should run tools in-process without the transport', async () => {
+      const result = await server.callTool('search_memory', { query: 'test', limit: 100 });
+      expect((result.content[0] as any).text).toBe('Error executing search_memory: Limit must be between 1 and 50');
+      expect(server['server'].connect).not.toHaveBeenCalled();
+    });
+
+    test('should initialize memory without connecting a transport', async () => {
+      const initialize = jest.spyOn(server['memoryManager'], 'initialize').mockResolvedValue(undefined);
+
+      await server.initialize();
+
+      expect(initialize).toHaveBeenCalled();
+      expect(server['server'].connect).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('start', () => {
+    test('should write the verbose tool banner in one call', async () => {
+      const verboseServer = new ProjectMemoryServer({ ...options, verbose: true });
+      jest.spyOn(verboseServer['memoryManager'], 'initialize').mockResolvedValue(undefined);
+      const consoleSpy = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+
+      try {
+        await verboseServer.start();
+
+        const banners = consoleSpy.mock.calls.filter(call => String(call[0]).includes('Tools available:'));
+        expect(banners).toHaveLength(1);
+        for (const tool of verboseServer['getToolDefinitions']()) {
+          expect(banners[0][0]).toContain(`  • ${tool.name} - ${tool.description}`);
+        }
+      } finally {
+        consoleSpy.mockRestore();
+      }
+    });
+  });
+
+  describe('startup', () => {
+    test('should hold tool calls until memory has loaded', async () => {
+      let finishLoading!: () => void;
+      jest.spyOn(server['memoryManager'], 'initialize')
+        .mockImplementation(() => new Promise<void>(resolve => { finishLoading = resolve; }));
+      const updatePriorities = jest.spyOn(server['memoryManager'], 'updatePriorities').mockResolvedValue(undefined);
+
+      const started = server.start();
+      const call = server.callTool('update_priorities', { priorities: ['Ship it'] });
+      await new Promise(resolve => setImmediate(resolve));
+      expect(server['server'].connect).toHaveBeenCalled();
+      expect(updatePriorities).not.toHaveBeenCalled();
+
+      finishLoading();
+      await Promise.all([started, call]);
+      expect(updatePriorities).toHaveBeenCalledWith(['Ship it']);
+    });
+  });
+
+  describe('startup failure', () => {
+    test('should close the transport when memory fails to load', async () => {
+      jest.spyOn(server['memoryManager'], 'initialize').mockRejectedValue(new Error('EACCES: permission denied'));
+
+      await expect(server.start()).rejects.toThrow('EACCES: permission denied');
+      expect(server['server'].connect).toHaveBeenCalled();
+      expect(server['server'].close).toHaveBeenCalled();
+    });
+  });
+
+  describe('shutdown', () => {
+    test('should wait for running calls, then flush memory and close', async () => {
+      let finishCall!: () => void;
+      jest.spyOn(server['memoryManager'], 'updatePriorities')
+        .mockImplementation(() => new Promise<void>(resolve => { finishCall = resolve; }));
+      const flush = jest.spyOn(server['memoryManager'], 'flush').mockResolvedValue(undefined);
+
+      const call = server.callTool('update_priorities', { priorities: ['Ship it'] });
+      const stopped = server.shutdown();
+      await new Promise(resolve => setImmediate(resolve));
+      expect(flush).not.toHaveBeenCalled();
+
+      finishCall();
+      await stopped;
+
+      expect((await call).content[0]).toEqual({ type: 'text', text: 'Successfully updated priorities (1 items)' });
+      expect(flush).toHaveBeenCalled();
+      expect(server['server'].close).toHaveBeenCalled();
+    });
+
+    test('should reject tool calls once shutting down', async () => {
+      jest.spyOn(server['memoryManager'], 'flush').mockResolvedValue(undefined);
+      await server.shutdown();
+
+      const result = await server.callTool('get_project_context');
+      expect((result.content[0] as any).text).toBe('Error executing get_project_context: Server is shutting down');
+    });
+  });
+
   describe('formatSearchResults', () => {
     test('should handle empty results', () => {
       const formatted = server['formatSearchResults']([]);
@@ -58,7 +195,7 @@ describe('ProjectMemoryServer', () => {
       const results = [{
         type: 'decision',
         relevance: 0.8,
-        data: 'Test decision content'
+        content: 'Test decision content'
       }];
       
       const formatted = server['formatSearchResults'](results);
@@ -70,8 +207,8 @@ describe('ProjectMemoryServer', () => {
 
     test('should format multiple results', () => {
       const results = [
-        { type: 'decision', relevance: 0.9, data: 'Decision 1' },
-        { type: 'solution', relevance: 0.7, data: 'Solution 1' }
+        { type: 'decision', relevance: 0.9, content: 'Decision 1' },
+        { type: 'solution', relevance: 0.7, content: 'Solution 1' }
       ];
       
       const formatted = server['formatSearchResults'](results);
@@ -85,7 +222,7 @@ describe('ProjectMemoryServer', () => {
       const results = [{
         type: 'decision',
         relevance: 0.8,
-        data: { decision: 'Use TypeScript', rationale: 'Better types' }
+        content: { decision: 'Use TypeScript', rationale: 'Better types' }
       }];
       
       const formatted = server['formatSearchResults'](results);
@@ -178,6 +315,26 @@ describe('ProjectMemoryServer', () => {
         .not.toThrow();
     });
 
+    test('should leave optional arguments to the handlers', () => {
+      expect(() => server['validateToolArguments']('add_architecture_decision', {
+        decision: 'Use React',
+        rationale: 'Component-based',
+        alternatives: 'Vue'
+      })).not.toThrow();
+      expect(() => server['validateToolArguments']('clear_memory', { confirm: true, scope: 'everything' }))
+        .not.toThrow();
+    });
+
+    test('should only check status values that are set', () => {
+      expect(() => server['validateToolArguments']('update_implementation_status', { component: 'test', status: '' }))
+        .not.toThrow();
+    });
+
+    test('should report unknown scopes with the valid choices', async () => {
+      const result = await server['handleToolCall']('clear_memory', { confirm: true, scope: 'everything', create_backup: false });
+      expect((result.content[0] as any).text).toContain('Unknown scope: everything. Use: all, decisions');
+    });
+
     test('should throw for unknown tool', () => {
       expect(() => server['validateToolArguments']('unknown_tool', {}))
         .toThrow('Unknown tool: unknown_tool');
@@ -7,12 +7,18 @@ jest.mock('fs-extra', () => ({
   ensureDir: jest.fn(),
   readFile: jest.fn(),
   writeFile: jest.fn(),
+  open: jest.fn(),
+  fdatasync: jest.fn(),
+  close: jest.fn(),
+  rename: jest.fn(),
   pathExists: jest.fn(),
   readJSON: jest.fn(),
   writeJSON: jest.fn(),
   mkdtemp: jest.fn(),
   remove: jest.fn(),
   writeJson: jest.fn(),
+  appendFile: jest.fn(),
+  copyFile: jest.fn(),
 }));
 
 // Mock MCP SDK